@@ -4,17 +4,88 @@ import Logging
 actor GitLabCLI {
     private let logger: Logger
     
-    init(logger: Logger) {
+    /// Upper bound on glab processes running at the same time.
+    private let maxConcurrentCommands: Int
+    private var runningCommands = 0
+    private var slotWaiters: [CheckedContinuation<Void, Never>] = []
+    
+    /// Recent results of idempotent reads, keyed by their arguments.
+    private var resultCache: [[String]: CachedResult] = [:]
+    private var inFlightReads: [[String]: Task<CommandResult, Error>] = [:]
+    /// Bumped by `invalidateCache()` so reads started before it cannot store their results.
+    private var cacheGeneration = 0
+    
+    private struct CachedResult {
+        let result: CommandResult
+        let expiresAt: ContinuousClock.Instant
+    }
+    
+    init(logger: Logger, maxConcurrentCommands: Int = GitLabCLI.defaultMaxConcurrentCommands) {
         self.logger = logger
+        self.maxConcurrentCommands = max(1, maxConcurrentCommands)
+    }
+    
+    /// Concurrency limit taken from `GLAB_MCP_CONCURRENCY`, defaulting to the core count (at least 4).
+    static var defaultMaxConcurrentCommands: Int {
+        if let value = ProcessInfo.processInfo.environment["GLAB_MCP_CONCURRENCY"],
+           let limit = Int(value), limit > 0 {
+            return limit
+        }
+        return max(4, ProcessInfo.processInfo.activeProcessorCount)
+    }
+    
+    /// Location of the glab executable. Only a successful lookup is kept, so
+    /// installing glab while the server runs takes effect on the next call.
+    private var glabExecutableURL: URL?
+    
+    private func resolveGlabExecutable() -> URL? {
+        if let glabExecutableURL {
+            return glabExecutableURL
+        }
+        glabExecutableURL = Self.findGlabInPath()
+        return glabExecutableURL
+    }
+    
+    /// Searches `PATH` for an executable regular file named glab, skipping
+    /// directories the way `/usr/bin/env` does.
+    private static func findGlabInPath() -> URL? {
+        let searchPath = ProcessInfo.processInfo.environment["PATH"] ?? "/usr/local/bin:/usr/bin:/bin"
+        for directory in searchPath.split(separator: ":") {
+            let candidate = URL(fileURLWithPath: String(directory)).appendingPathComponent("glab")
+            var isDirectory: ObjCBool = false
+            if FileManager.default.fileExists(atPath: candidate.path, isDirectory: &isDirectory),
+               !isDirectory.boolValue,
+               FileManager.default.isExecutableFile(atPath: candidate.path) {
+                return candidate
+            }
+        }
+        return nil
     }
     
     func runCommand(args: [String], cwd: String? = nil) async throws -> CommandResult {
-        let cmd = ["glab"] + args
-        logger.info("Running command: \(cmd.joined(separator: " "))")
+        guard let glabURL = resolveGlabExecutable() else {
+            logger.error("glab executable not found in PATH")
+            // Exit 127 matches what the shell or /usr/bin/env report for a missing command.
+            // The wording avoids the keywords formatResult maps to failure tips.
+            return CommandResult(
+                returnCode: 127,
+                stdout: "",
+                stderr: "glab executable is missing from PATH. Install it with `brew install glab`.",
+                success: false,
+                dataString: nil
+            )
+        }
+        
+        await acquireSlot()
+        defer { releaseSlot() }
         
+        logger.debug("Running command: glab \(args.joined(separator: " "))")
+        
+        // Exec glab directly instead of going through /usr/bin/env,
+        // which saves a second exec and PATH lookup on every call.
         let process = Process()
-        process.executableURL = URL(fileURLWithPath: "/usr/bin/env")
-        process.arguments = cmd
+        process.executableURL = glabURL
+        process.arguments = args
         
         if let cwd = cwd {
             process.currentDirectoryURL = URL(fileURLWithPath: cwd)
@@ -26,28 +97,47 @@ actor GitLabCLI {
         process.standardError = stderrPipe
         
         do {
+            // Wait for exit without blocking a cooperative thread, so other
+            // commands can run while this one is in flight.
+            let (exitStatuses, exitContinuation) = AsyncStream<Int32>.makeStream()
+            process.terminationHandler = { process in
+                exitContinuation.yield(process.terminationStatus)
+                exitContinuation.finish()
+            }
+            
             try process.run()
-            process.waitUntilExit()
             
-            let stdoutData = stdoutPipe.fileHandleForReading.readDataToEndOfFile()
-            let stderrData = stderrPipe.fileHandleForReading.readDataToEndOfFile()
+            // Drain both pipes while glab runs; reading only after exit would
+            // stall glab once its output fills the pipe buffer.
+            let stdoutHandle = stdoutPipe.fileHandleForReading
+            let stderrHandle = stderrPipe.fileHandleForReading
+            async let stdoutRead = Self.readToEnd(stdoutHandle)
+            async let stderrRead = Self.readToEnd(stderrHandle)
             
-            let stdout = String(data: stdoutData, encoding: .utf8) ?? ""
-            let stderr = String(data: stderrData, encoding: .utf8) ?? ""
-            let returnCode = Int(process.terminationStatus)
+            var terminationStatus: Int32 = -1
+            for await status in exitStatuses {
+                terminationStatus = status
+            }
+            let (stdoutData, stderrData) = await (stdoutRead, stderrRead)
+            
+            // Most successful commands write nothing to stderr; skip decoding then.
+            let stderr = stderrData.isEmpty ? "" : String(data: stderrData, encoding: .utf8) ?? ""
+            let returnCode = Int(terminationStatus)
             let success = returnCode == 0
             
+            let stdout: String
             var dataString: String? = nil
             
-            // Try to parse JSON output if it looks like JSON
-            if success && !stdout.isEmpty {
-                let trimmedStdout = stdout.trimmingCharacters(in: .whitespacesAndNewlines)
-                if trimmedStdout.hasPrefix("[") || trimmedStdout.hasPrefix("{") {
-                    if let jsonData = trimmedStdout.data(using: .utf8),
-                       let _ = try? JSONSerialization.jsonObject(with: jsonData) {
-                        dataString = trimmedStdout
-                    }
-                }
+            // Try to parse JSON output if it looks like JSON.
+            // Sniff and validate the raw bytes, then decode the trimmed JSON
+            // once and share it as stdout instead of decoding and trimming twice.
+            if success, Self.looksLikeJSON(stdoutData),
+               let _ = try? JSONSerialization.jsonObject(with: stdoutData) {
+                let jsonText = Self.decodeTrimmed(stdoutData)
+                stdout = jsonText
+                dataString = jsonText
+            } else {
+                stdout = String(data: stdoutData, encoding: .utf8) ?? ""
             }
             
             return CommandResult(
@@ -68,4 +158,136 @@ actor GitLabCLI {
             )
         }
     }
+    
+    // MARK: - Result Caching
+    
+    /// Runs an idempotent read, reusing a successful result younger than `ttl`.
+    /// Concurrent identical calls share a single glab process.
+    func runCachedCommand(args: [String], ttl: Duration) async throws -> CommandResult {
+        if let cached = resultCache[args], cached.expiresAt > ContinuousClock.now {
+            logger.debug("Using cached result for: glab \(args.joined(separator: " "))")
+            return cached.result
+        }
+        
+        if let pending = inFlightReads[args] {
+            return try await pending.value
+        }
+        
+        let generation = cacheGeneration
+        let task = Task { try await self.runCommand(args: args) }
+        inFlightReads[args] = task
+        defer {
+            // A newer read may have replaced this one after an invalidation.
+            if inFlightReads[args] == task {
+                inFlightReads[args] = nil
+            }
+        }
+        
+        let result = try await task.value
+        // Skip the store if the cache was invalidated while this read was running;
+        // its result may predate the change that caused the invalidation.
+        if result.success && generation == cacheGeneration {
+            // Drop expired entries on every store so results for one-off
+            // arguments do not stay in memory for the life of the server.
+            let now = ContinuousClock.now
+            resultCache = resultCache.filter { $0.value.expiresAt > now }
+            resultCache[args] = CachedResult(result: result, expiresAt: now + ttl)
+        }
+        return result
+    }
+    
+    /// Drops all cached and in-flight reads, e.g. after a command that may change what they report.
+    /// Later identical reads start a fresh glab process instead of joining one that began before the change.
+    func invalidateCache() {
+        cacheGeneration += 1
+        resultCache.removeAll()
+        inFlightReads.removeAll()
+    }
+    
+    // MARK: - Output Parsing
+    
+    /// Collects a pipe's output until EOF. `readabilityHandler` only runs when data is
+    /// available, so no thread is parked per pipe however many commands are running.
+    private static func readToEnd(_ handle: FileHandle) async -> Data {
+        await withCheckedContinuation { continuation in
+            let buffer = PipeBuffer()
+            handle.readabilityHandler = { handle in
+                let chunk = handle.availableData
+                if !chunk.isEmpty {
+                    buffer.append(chunk)
+                    return
+                }
+                // An empty read means EOF.
+                handle.readabilityHandler = nil
+                if let data = buffer.finish() {
+                    continuation.resume(returning: data)
+                }
+            }
+        }
+    }
+    
+    private static func isJSONWhitespace(_ byte: UInt8) -> Bool {
+        byte == UInt8(ascii: " ") || byte == UInt8(ascii: "\t") ||
+            byte == UInt8(ascii: "\n") || byte == UInt8(ascii: "\r")
+    }
+    
+    /// Checks whether the first non-whitespace byte opens a JSON array or object.
+    /// Stops at that byte instead of trimming the whole output.
+    private static func looksLikeJSON(_ data: Data) -> Bool {
+        let first = data.first { !isJSONWhitespace($0) }
+        return first == UInt8(ascii: "[") || first == UInt8(ascii: "{")
+    }
+    
+    /// Decodes only the span between leading and trailing whitespace.
+    private static func decodeTrimmed(_ data: Data) -> String {
+        guard let start = data.firstIndex(where: { !isJSONWhitespace($0) }),
+              let end = data.lastIndex(where: { !isJSONWhitespace($0) }) else {
+            return ""
+        }
+        return String(decoding: data[start...end], as: UTF8.self)
+    }
+    
+    // MARK: - Concurrency Limiting
+    
+    private func acquireSlot() async {
+        if runningCommands < maxConcurrentCommands {
+            runningCommands += 1
+            return
+        }
+        await withCheckedContinuation { continuation in
+            slotWaiters.append(continuation)
+        }
+    }
+    
+    private func releaseSlot() {
+        if slotWaiters.isEmpty {
+            runningCommands -= 1
+        } else {
+            // Hand the slot straight to the next waiter.
+            slotWaiters.removeFirst().resume()
+        }
+    }
+}
+
+/// Output accumulated by a pipe's readability handler.
+private final class PipeBuffer: @unchecked Sendable {
+    private let lock = NSLock()
+    private var data = Data()
+    private var finished = false
+    
+    func append(_ chunk: Data) {
+        lock.lock()
+        defer { lock.unlock() }
+        data.append(chunk)
+    }
+    
+    /// Returns the collected output the first time it is called and nil afterwards,
+    /// since the handler can fire again on EOF before it is removed.
+    func finish() -> Data? {
+        lock.lock()
+        defer { lock.unlock() }
+        guard !finished else { return nil }
+        finished = true
+        return data
+    }
 }
\ No newline at end of file
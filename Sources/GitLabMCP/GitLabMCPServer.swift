@@ -20,13 +20,13 @@ actor GitLabMCPServer {
                 tools: .init(listChanged: false)
             )
         )
-        
-        Task {
-            await setupHandlers()
-        }
     }
     
     func start() async throws {
+        // Register handlers before the transport opens so the first requests
+        // never arrive ahead of them. Nothing else is awaited before serving.
+        await setupHandlers()
+        
         let transport = StdioTransport(logger: logger)
         try await server.start(transport: transport)
         logger.info("GitLab MCP Server started")
@@ -73,208 +73,244 @@ actor GitLabMCPServer {
         }
     }
     
-    private func getStaticTools() -> ListTools.Result {
-        let tools: [Tool] = [
-            // Merge Request operations
-            Tool(
-                name: "glab_mr",
-                description: """
-                Work with GitLab merge requests.
-                Examples:
-                - List your MRs: subcommand="list", args=["--assignee=@me"]
-                - View MR #123: subcommand="view", args=["123"]
-                - Create MR: subcommand="create", args=["--title", "Fix: Memory leak", "--source-branch", "fix/memory"]
-                - List MRs for repo: subcommand="list", args=["--repo", "team/project"]
-                """,
-                inputSchema: .object([
-                    "type": .string("object"),
-                    "properties": .object([
-                        "subcommand": .object([
-                            "type": .string("string"),
-                            "enum": .array([.string("list"), .string("create"), .string("view"), .string("merge"), .string("close"), .string("reopen"), .string("update"), .string("approve"), .string("revoke"), .string("diff"), .string("checkout")]),
-                            "description": .string("The merge request operation to perform")
-                        ]),
-                        "args": .object([
-                            "type": .string("array"),
-                            "items": .object(["type": .string("string")]),
-                            "description": .string("Additional arguments like MR number, flags, etc. Example: ['123'] for MR #123, or ['--assignee=@me', '--state=opened'] for filters")
-                        ]),
-                        "repo": .object([
-                            "type": .string("string"),
-                            "description": .string("Repository in OWNER/REPO format (optional, uses current repo if not specified)")
-                        ])
+    /// Tool definitions are static for the lifetime of the server, so they are
+    /// built once on first access instead of on every ListTools request.
+    private static let staticTools: [Tool] = [
+        // Merge Request operations
+        Tool(
+            name: "glab_mr",
+            description: """
+            Work with GitLab merge requests.
+            Examples:
+            - List your MRs: subcommand="list", args=["--assignee=@me"]
+            - View MR #123: subcommand="view", args=["123"]
+            - Create MR: subcommand="create", args=["--title", "Fix: Memory leak", "--source-branch", "fix/memory"]
+            - List MRs for repo: subcommand="list", args=["--repo", "team/project"]
+            """,
+            inputSchema: .object([
+                "type": .string("object"),
+                "properties": .object([
+                    "subcommand": .object([
+                        "type": .string("string"),
+                        "enum": .array([.string("list"), .string("create"), .string("view"), .string("merge"), .string("close"), .string("reopen"), .string("update"), .string("approve"), .string("revoke"), .string("diff"), .string("checkout")]),
+                        "description": .string("The merge request operation to perform")
+                    ]),
+                    "args": .object([
+                        "type": .string("array"),
+                        "items": .object(["type": .string("string")]),
+                        "description": .string("Additional arguments like MR number, flags, etc. Example: ['123'] for MR #123, or ['--assignee=@me', '--state=opened'] for filters")
                     ]),
-                    "required": .array([.string("subcommand")])
+                    "repo": .object([
+                        "type": .string("string"),
+                        "description": .string("Repository in OWNER/REPO format (optional, uses current repo if not specified)")
+                    ])
                 ]),
-                annotations: .init(
-                    title: "GitLab Merge Requests",
-                    readOnlyHint: false,
-                    destructiveHint: false,
-                    idempotentHint: false
-                )
-            ),
-            
-            // Issue operations
-            Tool(
-                name: "glab_issue",
-                description: "Work with GitLab issues. Common operations: list (list issues), create (create new issue), view (view issue details), close (close an issue)",
-                inputSchema: .object([
-                    "type": .string("object"),
-                    "properties": .object([
-                        "subcommand": .object([
-                            "type": .string("string"),
-                            "enum": .array([.string("list"), .string("create"), .string("view"), .string("close"), .string("reopen"), .string("update"), .string("delete"), .string("subscribe"), .string("unsubscribe"), .string("note")]),
-                            "description": .string("The issue operation to perform")
-                        ]),
-                        "args": .object([
-                            "type": .string("array"),
-                            "items": .object(["type": .string("string")]),
-                            "description": .string("Additional arguments like issue number, flags, etc.")
-                        ]),
-                        "repo": .object([
-                            "type": .string("string"),
-                            "description": .string("Repository in OWNER/REPO format (optional)")
-                        ])
+                "required": .array([.string("subcommand")])
+            ]),
+            annotations: .init(
+                title: "GitLab Merge Requests",
+                readOnlyHint: false,
+                destructiveHint: false,
+                idempotentHint: false
+            )
+        ),
+        
+        // Issue operations
+        Tool(
+            name: "glab_issue",
+            description: "Work with GitLab issues. Common operations: list (list issues), create (create new issue), view (view issue details), close (close an issue)",
+            inputSchema: .object([
+                "type": .string("object"),
+                "properties": .object([
+                    "subcommand": .object([
+                        "type": .string("string"),
+                        "enum": .array([.string("list"), .string("create"), .string("view"), .string("close"), .string("reopen"), .string("update"), .string("delete"), .string("subscribe"), .string("unsubscribe"), .string("note")]),
+                        "description": .string("The issue operation to perform")
                     ]),
-                    "required": .array([.string("subcommand")])
-                ])
-            ),
-            
-            // CI/CD operations
-            Tool(
-                name: "glab_ci",
-                description: "Work with GitLab CI/CD pipelines and jobs. Common operations: view (view pipeline status), list (list pipelines), run (trigger pipeline), retry (retry failed pipeline)",
-                inputSchema: .object([
-                    "type": .string("object"),
-                    "properties": .object([
-                        "subcommand": .object([
-                            "type": .string("string"),
-                            "enum": .array([.string("view"), .string("list"), .string("run"), .string("retry"), .string("delete"), .string("cancel"), .string("trace"), .string("artifact")]),
-                            "description": .string("The CI/CD operation to perform")
-                        ]),
-                        "args": .object([
-                            "type": .string("array"),
-                            "items": .object(["type": .string("string")]),
-                            "description": .string("Additional arguments like pipeline ID, job ID, flags, etc.")
-                        ]),
-                        "repo": .object([
-                            "type": .string("string"),
-                            "description": .string("Repository in OWNER/REPO format (optional)")
-                        ])
+                    "args": .object([
+                        "type": .string("array"),
+                        "items": .object(["type": .string("string")]),
+                        "description": .string("Additional arguments like issue number, flags, etc.")
                     ]),
-                    "required": .array([.string("subcommand")])
-                ])
-            ),
-            
-            // Repository operations
-            Tool(
-                name: "glab_repo",
-                description: "Work with GitLab repositories. Common operations: clone (clone a repo), fork (fork a repo), view (view repo details), archive (archive a repo)",
-                inputSchema: .object([
-                    "type": .string("object"),
-                    "properties": .object([
-                        "subcommand": .object([
-                            "type": .string("string"),
-                            "enum": .array([.string("clone"), .string("fork"), .string("view"), .string("archive"), .string("unarchive"), .string("delete"), .string("create"), .string("list"), .string("mirror"), .string("contributors")]),
-                            "description": .string("The repository operation to perform")
-                        ]),
-                        "args": .object([
-                            "type": .string("array"),
-                            "items": .object(["type": .string("string")]),
-                            "description": .string("Additional arguments like repo name, flags, etc.")
-                        ])
+                    "repo": .object([
+                        "type": .string("string"),
+                        "description": .string("Repository in OWNER/REPO format (optional)")
+                    ])
+                ]),
+                "required": .array([.string("subcommand")])
+            ])
+        ),
+        
+        // CI/CD operations
+        Tool(
+            name: "glab_ci",
+            description: "Work with GitLab CI/CD pipelines and jobs. Common operations: view (view pipeline status), list (list pipelines), run (trigger pipeline), retry (retry failed pipeline)",
+            inputSchema: .object([
+                "type": .string("object"),
+                "properties": .object([
+                    "subcommand": .object([
+                        "type": .string("string"),
+                        "enum": .array([.string("view"), .string("list"), .string("run"), .string("retry"), .string("delete"), .string("cancel"), .string("trace"), .string("artifact")]),
+                        "description": .string("The CI/CD operation to perform")
                     ]),
-                    "required": .array([.string("subcommand")])
-                ])
-            ),
-            
-            // API operations
-            Tool(
-                name: "glab_api",
-                description: "Make authenticated requests to the GitLab API. Supports GET, POST, PUT, PATCH, DELETE methods.",
-                inputSchema: .object([
-                    "type": .string("object"),
-                    "properties": .object([
-                        "method": .object([
-                            "type": .string("string"),
-                            "enum": .array([.string("GET"), .string("POST"), .string("PUT"), .string("PATCH"), .string("DELETE")]),
-                            "description": .string("HTTP method to use")
-                        ]),
-                        "endpoint": .object([
-                            "type": .string("string"),
-                            "description": .string("API endpoint path, e.g., '/projects/:id/merge_requests'")
-                        ]),
-                        "data": .object([
-                            "type": .string("string"),
-                            "description": .string("JSON data for POST/PUT/PATCH requests (optional)")
-                        ]),
-                        "headers": .object([
-                            "type": .string("array"),
-                            "items": .object(["type": .string("string")]),
-                            "description": .string("Additional headers in 'key:value' format (optional)")
-                        ])
+                    "args": .object([
+                        "type": .string("array"),
+                        "items": .object(["type": .string("string")]),
+                        "description": .string("Additional arguments like pipeline ID, job ID, flags, etc.")
                     ]),
-                    "required": .array([.string("method"), .string("endpoint")])
-                ])
-            ),
-            
-            // Authentication
-            Tool(
-                name: "glab_auth",
-                description: "Manage GitLab authentication. Operations: login (authenticate), status (check auth status), logout (remove authentication)",
-                inputSchema: .object([
-                    "type": .string("object"),
-                    "properties": .object([
-                        "subcommand": .object([
-                            "type": .string("string"),
-                            "enum": .array([.string("login"), .string("status"), .string("logout")]),
-                            "description": .string("The authentication operation to perform")
-                        ]),
-                        "args": .object([
-                            "type": .string("array"),
-                            "items": .object(["type": .string("string")]),
-                            "description": .string("Additional arguments like --hostname, --token, etc.")
-                        ])
+                    "repo": .object([
+                        "type": .string("string"),
+                        "description": .string("Repository in OWNER/REPO format (optional)")
+                    ])
+                ]),
+                "required": .array([.string("subcommand")])
+            ])
+        ),
+        
+        // Repository operations
+        Tool(
+            name: "glab_repo",
+            description: "Work with GitLab repositories. Common operations: clone (clone a repo), fork (fork a repo), view (view repo details), archive (archive a repo)",
+            inputSchema: .object([
+                "type": .string("object"),
+                "properties": .object([
+                    "subcommand": .object([
+                        "type": .string("string"),
+                        "enum": .array([.string("clone"), .string("fork"), .string("view"), .string("archive"), .string("unarchive"), .string("delete"), .string("create"), .string("list"), .string("mirror"), .string("contributors")]),
+                        "description": .string("The repository operation to perform")
                     ]),
-                    "required": .array([.string("subcommand")])
-                ])
-            ),
-            
-            // Version information
-            Tool(
-                name: "glab_version",
-                description: """
-                Show version information for both the GitLab MCP server and glab CLI.
-                Shows current authentication status from glab.
-                Always use this first to verify the server is working correctly.
-                """,
-                inputSchema: .object([
-                    "type": .string("object"),
-                    "properties": .object([:]),
-                    "required": .array([])
-                ])
-            ),
-            
-            // Raw command execution
-            Tool(
-                name: "glab_raw",
-                description: "Execute any glab command directly. Use this for commands not covered by other tools.",
-                inputSchema: .object([
-                    "type": .string("object"),
-                    "properties": .object([
-                        "args": .object([
-                            "type": .string("array"),
-                            "items": .object(["type": .string("string")]),
-                            "description": .string("Complete command arguments (without 'glab'). Example: ['config', 'get', 'editor']")
-                        ])
+                    "args": .object([
+                        "type": .string("array"),
+                        "items": .object(["type": .string("string")]),
+                        "description": .string("Additional arguments like repo name, flags, etc.")
+                    ])
+                ]),
+                "required": .array([.string("subcommand")])
+            ])
+        ),
+        
+        // API operations
+        Tool(
+            name: "glab_api",
+            description: "Make authenticated requests to the GitLab API. Supports GET, POST, PUT, PATCH, DELETE methods.",
+            inputSchema: .object([
+                "type": .string("object"),
+                "properties": .object([
+                    "method": .object([
+                        "type": .string("string"),
+                        "enum": .array([.string("GET"), .string("POST"), .string("PUT"), .string("PATCH"), .string("DELETE")]),
+                        "description": .string("HTTP method to use")
                     ]),
-                    "required": .array([.string("args")])
-                ])
-            )
-        ]
-        
-        logger.info("Providing \(tools.count) static tools")
-        return ListTools.Result(tools: tools)
+                    "endpoint": .object([
+                        "type": .string("string"),
+                        "description": .string("API endpoint path, e.g., '/projects/:id/merge_requests'")
+                    ]),
+                    "data": .object([
+                        "type": .string("string"),
+                        "description": .string("JSON data for POST/PUT/PATCH requests (optional)")
+                    ]),
+                    "headers": .object([
+                        "type": .string("array"),
+                        "items": .object(["type": .string("string")]),
+                        "description": .string("Additional headers in 'key:value' format (optional)")
+                    ])
+                ]),
+                "required": .array([.string("method"), .string("endpoint")])
+            ])
+        ),
+        
+        // Authentication
+        Tool(
+            name: "glab_auth",
+            description: "Manage GitLab authentication. Operations: login (authenticate), status (check auth status), logout (remove authentication)",
+            inputSchema: .object([
+                "type": .string("object"),
+                "properties": .object([
+                    "subcommand": .object([
+                        "type": .string("string"),
+                        "enum": .array([.string("login"), .string("status"), .string("logout")]),
+                        "description": .string("The authentication operation to perform")
+                    ]),
+                    "args": .object([
+                        "type": .string("array"),
+                        "items": .object(["type": .string("string")]),
+                        "description": .string("Additional arguments like --hostname, --token, etc.")
+                    ])
+                ]),
+                "required": .array([.string("subcommand")])
+            ])
+        ),
+        
+        // Version information
+        Tool(
+            name: "glab_version",
+            description: """
+            Show version information for both the GitLab MCP server and glab CLI.
+            Shows current authentication status from glab.
+            Always use this first to verify the server is working correctly.
+            """,
+            inputSchema: .object([
+                "type": .string("object"),
+                "properties": .object([:]),
+                "required": .array([])
+            ])
+        ),
+        
+        // Raw command execution
+        Tool(
+            name: "glab_raw",
+            description: "Execute any glab command directly. Use this for commands not covered by other tools.",
+            inputSchema: .object([
+                "type": .string("object"),
+                "properties": .object([
+                    "args": .object([
+                        "type": .string("array"),
+                        "items": .object(["type": .string("string")]),
+                        "description": .string("Complete command arguments (without 'glab'). Example: ['config', 'get', 'editor']")
+                    ])
+                ]),
+                "required": .array([.string("args")])
+            ])
+        ),
+        
+        // Concurrent batch execution
+        Tool(
+            name: "glab_bulk",
+            description: """
+            Run several of the other glab tools concurrently and return their results together.
+            Use this when you need independent results at once, e.g. listing MRs, issues and pipelines for a repo.
+            Example: calls=[{"name": "glab_mr", "arguments": {"subcommand": "list"}}, {"name": "glab_ci", "arguments": {"subcommand": "list"}}]
+            """,
+            inputSchema: .object([
+                "type": .string("object"),
+                "properties": .object([
+                    "calls": .object([
+                        "type": .string("array"),
+                        "items": .object([
+                            "type": .string("object"),
+                            "properties": .object([
+                                "name": .object([
+                                    "type": .string("string"),
+                                    "description": .string("Tool to call, e.g. 'glab_mr'")
+                                ]),
+                                "arguments": .object([
+                                    "type": .string("object"),
+                                    "description": .string("Arguments for that tool")
+                                ])
+                            ]),
+                            "required": .array([.string("name")])
+                        ]),
+                        "description": .string("Tool calls to run concurrently")
+                    ])
+                ]),
+                "required": .array([.string("calls")])
+            ])
+        )
+    ]
+    
+    private func getStaticTools() -> ListTools.Result {
+        logger.debug("Providing \(Self.staticTools.count) static tools")
+        return ListTools.Result(tools: Self.staticTools)
     }
     
     private func handleToolCall(name: String, arguments: [String: Value]?) async throws -> CallTool.Result {
@@ -283,25 +319,14 @@ actor GitLabMCPServer {
         logger.debug("Tool call: \(name)")
         logger.debug("Arguments: \(args)")
         
+        if let spec = Self.subcommandTools[name] {
+            return try await handleSubcommandTool(name: name, command: spec.command, acceptsRepo: spec.acceptsRepo, args: args)
+        }
+        
         switch name {
-        case "glab_mr":
-            return try await handleMergeRequest(args: args)
-            
-        case "glab_issue":
-            return try await handleIssue(args: args)
-            
-        case "glab_ci":
-            return try await handleCI(args: args)
-            
-        case "glab_repo":
-            return try await handleRepo(args: args)
-            
         case "glab_api":
             return try await handleAPI(args: args)
             
-        case "glab_auth":
-            return try await handleAuth(args: args)
-            
         case "glab_version":
             return try await handleVersion()
             
@@ -311,8 +336,13 @@ actor GitLabMCPServer {
                 throw MCPError.invalidParams("args array is required")
             }
             let result = try await gitlabCLI.runCommand(args: cmdArgs)
+            // Raw commands can do anything, including logging in or out.
+            await gitlabCLI.invalidateCache()
             return formatResult(result)
             
+        case "glab_bulk":
+            return try await handleBulk(args: args)
+            
         default:
             throw MCPError.methodNotFound("Unknown tool: \(name)")
         }
@@ -320,86 +350,22 @@ actor GitLabMCPServer {
     
     // MARK: - Tool Handlers
     
-    private func handleMergeRequest(args: [String: Value]) async throws -> CallTool.Result {
-        guard case .string(let subcommand) = args["subcommand"] else {
-            throw MCPError.invalidParams("subcommand is required for glab_mr")
-        }
-        
-        var cmdArgs = ["mr", subcommand]
-        
-        // Add repository if specified
-        if case .string(let repo) = args["repo"] {
-            cmdArgs.append(contentsOf: ["-R", repo])
-        }
-        
-        // Add additional arguments
-        if case .array(let argsArray) = args["args"],
-           let additionalArgs = argsArray.compactMap({ $0.stringValue }) as? [String] {
-            cmdArgs.append(contentsOf: additionalArgs)
-        }
-        
-        let result = try await gitlabCLI.runCommand(args: cmdArgs)
-        return formatResult(result)
-    }
-    
-    private func handleIssue(args: [String: Value]) async throws -> CallTool.Result {
-        guard case .string(let subcommand) = args["subcommand"] else {
-            throw MCPError.invalidParams("subcommand is required for glab_issue")
-        }
-        
-        var cmdArgs = ["issue", subcommand]
-        
-        // Add repository if specified
-        if case .string(let repo) = args["repo"] {
-            cmdArgs.append(contentsOf: ["-R", repo])
-        }
-        
-        // Add additional arguments
-        if case .array(let argsArray) = args["args"],
-           let additionalArgs = argsArray.compactMap({ $0.stringValue }) as? [String] {
-            cmdArgs.append(contentsOf: additionalArgs)
-        }
-        
-        let result = try await gitlabCLI.runCommand(args: cmdArgs)
-        return formatResult(result)
-    }
-    
-    private func handleCI(args: [String: Value]) async throws -> CallTool.Result {
-        guard case .string(let subcommand) = args["subcommand"] else {
-            throw MCPError.invalidParams("subcommand is required for glab_ci")
-        }
-        
-        var cmdArgs = ["ci", subcommand]
-        
-        // Add repository if specified
-        if case .string(let repo) = args["repo"] {
-            cmdArgs.append(contentsOf: ["-R", repo])
-        }
-        
-        // Add additional arguments
-        if case .array(let argsArray) = args["args"],
-           let additionalArgs = argsArray.compactMap({ $0.stringValue }) as? [String] {
-            cmdArgs.append(contentsOf: additionalArgs)
-        }
-        
-        let result = try await gitlabCLI.runCommand(args: cmdArgs)
-        return formatResult(result)
-    }
+    /// glab command behind each subcommand-style tool, and whether it accepts `repo` (`-R`).
+    private static let subcommandTools: [String: (command: String, acceptsRepo: Bool)] = [
+        "glab_mr": ("mr", true),
+        "glab_issue": ("issue", true),
+        "glab_ci": ("ci", true),
+        "glab_repo": ("repo", false),
+        "glab_auth": ("auth", false)
+    ]
     
-    private func handleRepo(args: [String: Value]) async throws -> CallTool.Result {
+    private func handleSubcommandTool(name: String, command: String, acceptsRepo: Bool, args: [String: Value]) async throws -> CallTool.Result {
         guard case .string(let subcommand) = args["subcommand"] else {
-            throw MCPError.invalidParams("subcommand is required for glab_repo")
+            throw MCPError.invalidParams("subcommand is required for \(name)")
         }
         
-        var cmdArgs = ["repo", subcommand]
-        
-        // Add additional arguments
-        if case .array(let argsArray) = args["args"],
-           let additionalArgs = argsArray.compactMap({ $0.stringValue }) as? [String] {
-            cmdArgs.append(contentsOf: additionalArgs)
-        }
-        
-        let result = try await gitlabCLI.runCommand(args: cmdArgs)
+        let cmdArgs = buildCommandArgs(command: command, subcommand: subcommand, args: args, includeRepo: acceptsRepo)
+        let result = try await runSubcommand(cmdArgs, command: command, subcommand: subcommand)
         return formatResult(result)
     }
     
@@ -417,32 +383,78 @@ actor GitLabMCPServer {
         }
         
         // Add headers if provided
-        if case .array(let headersArray) = args["headers"],
-           let headers = headersArray.compactMap({ $0.stringValue }) as? [String] {
+        if case .array(let headersArray) = args["headers"] {
+            let headers = headersArray.compactMap { $0.stringValue }
+            cmdArgs.reserveCapacity(cmdArgs.count + 2 * headers.count)
             for header in headers {
-                cmdArgs.append(contentsOf: ["--header", header])
+                cmdArgs.append("--header")
+                cmdArgs.append(header)
             }
         }
         
         let result = try await gitlabCLI.runCommand(args: cmdArgs)
+        // Like glab_raw, API writes can change anything, including what cached reads report.
+        if method.uppercased() != "GET" {
+            await gitlabCLI.invalidateCache()
+        }
         return formatResult(result)
     }
     
-    private func handleAuth(args: [String: Value]) async throws -> CallTool.Result {
-        guard case .string(let subcommand) = args["subcommand"] else {
-            throw MCPError.invalidParams("subcommand is required for glab_auth")
+    private func handleBulk(args: [String: Value]) async throws -> CallTool.Result {
+        guard case .array(let callsArray) = args["calls"], !callsArray.isEmpty else {
+            throw MCPError.invalidParams("calls array is required for glab_bulk")
         }
         
-        var cmdArgs = ["auth", subcommand]
+        var calls: [(name: String, arguments: [String: Value]?)] = []
+        calls.reserveCapacity(callsArray.count)
+        for call in callsArray {
+            guard case .object(let callObject) = call,
+                  case .string(let toolName) = callObject["name"] else {
+                throw MCPError.invalidParams("each glab_bulk call needs a tool name")
+            }
+            guard toolName != "glab_bulk" else {
+                throw MCPError.invalidParams("glab_bulk calls cannot be nested")
+            }
+            
+            var toolArguments: [String: Value]? = nil
+            if case .object(let object) = callObject["arguments"] {
+                toolArguments = object
+            }
+            calls.append((name: toolName, arguments: toolArguments))
+        }
         
-        // Add additional arguments
-        if case .array(let argsArray) = args["args"],
-           let additionalArgs = argsArray.compactMap({ $0.stringValue }) as? [String] {
-            cmdArgs.append(contentsOf: additionalArgs)
+        // Run all calls at once; GitLabCLI still caps how many glab processes run together.
+        // A failing call is reported in place instead of failing the whole batch.
+        let results = await withTaskGroup(of: (Int, CallTool.Result).self) { group in
+            for (index, call) in calls.enumerated() {
+                group.addTask {
+                    do {
+                        return (index, try await self.handleToolCall(name: call.name, arguments: call.arguments))
+                    } catch {
+                        return (index, CallTool.Result(content: [.text("❌ \(error.localizedDescription)")], isError: true))
+                    }
+                }
+            }
+            
+            var ordered = [CallTool.Result?](repeating: nil, count: calls.count)
+            for await (index, result) in group {
+                ordered[index] = result
+            }
+            return ordered.compactMap { $0 }
         }
         
-        let result = try await gitlabCLI.runCommand(args: cmdArgs)
-        return formatResult(result)
+        var content: [Tool.Content] = []
+        for (index, (call, result)) in zip(calls, results).enumerated() {
+            content.append(.text("### \(index + 1). \(call.name)"))
+            content.append(contentsOf: result.content)
+        }
+        
+        // Failed calls carry their own ❌ section; only flag the batch when nothing succeeded,
+        // so clients don't treat a partly successful batch as a failed tool call.
+        return CallTool.Result(
+            content: content,
+            isError: results.allSatisfy { $0.isError == true }
+        )
     }
     
     private func handleVersion() async throws -> CallTool.Result {
@@ -452,7 +464,7 @@ actor GitLabMCPServer {
         versionInfo += "Build Date: \(Date().formatted(date: .abbreviated, time: .shortened))\n\n"
         
         // Get glab version
-        let result = try await gitlabCLI.runCommand(args: ["version"])
+        let result = try await gitlabCLI.runCachedCommand(args: ["version"], ttl: Self.versionCacheTTL)
         if result.success {
             versionInfo += "GLab CLI Version:\n"
             versionInfo += result.stdout
@@ -468,44 +480,132 @@ actor GitLabMCPServer {
     
     // MARK: - Helper Methods
     
+    /// Idempotent reads whose results are reused for a short time, keyed by "<command> <subcommand>".
+    private static let cachedReads: [String: Duration] = [
+        "auth status": .seconds(30),
+        "repo view": .seconds(15)
+    ]
+    
+    /// Commands that may change what the cached reads report.
+    private static let cacheInvalidatingCommands: Set<String> = ["auth", "repo"]
+    
+    private static let versionCacheTTL: Duration = .seconds(300)
+    
+    /// glab's `--web`/`-w` flag, which opens the result in a browser instead of printing it.
+    private static func isBrowserFlag(_ arg: String) -> Bool {
+        arg == "--web" || arg == "-w" || arg.hasPrefix("--web=")
+    }
+    
+    /// Runs a subcommand, serving cached results for idempotent reads and
+    /// dropping the cache after commands that may invalidate them.
+    private func runSubcommand(_ cmdArgs: [String], command: String, subcommand: String) async throws -> CommandResult {
+        if let ttl = Self.cachedReads["\(command) \(subcommand)"] {
+            // Opening a browser is a side effect, so those calls must run every time.
+            // They change nothing the cache holds, so no invalidation is needed.
+            if cmdArgs.contains(where: Self.isBrowserFlag) {
+                return try await gitlabCLI.runCommand(args: cmdArgs)
+            }
+            return try await gitlabCLI.runCachedCommand(args: cmdArgs, ttl: ttl)
+        }
+        
+        let result = try await gitlabCLI.runCommand(args: cmdArgs)
+        if Self.cacheInvalidatingCommands.contains(command) {
+            await gitlabCLI.invalidateCache()
+        }
+        return result
+    }
+    
+    /// Suggestions for common glab failures. Checked in order, so earlier entries win
+    /// when stderr matches several of them.
+    private static let errorTips: [(patterns: [String], tip: String)] = [
+        (["authentication", "401"], "This looks like an authentication issue. Try running `glab auth login` in your terminal."),
+        (["not found", "404"], "The resource was not found. Check if the MR/issue number or repository name is correct."),
+        (["permission", "403"], "You don't have permission to perform this action. Check your access rights."),
+        (["no repository"], "Make sure you're in a Git repository or specify the repository with the 'repo' parameter.")
+    ]
+    
+    /// Builds `<command> <subcommand> [-R repo] [args...]`, sizing the array once up front.
+    private func buildCommandArgs(command: String, subcommand: String, args: [String: Value], includeRepo: Bool) -> [String] {
+        var additionalArgs: [String] = []
+        if case .array(let argsArray) = args["args"] {
+            additionalArgs = argsArray.compactMap { $0.stringValue }
+        }
+        
+        var cmdArgs: [String] = []
+        cmdArgs.reserveCapacity(4 + additionalArgs.count)
+        cmdArgs.append(command)
+        cmdArgs.append(subcommand)
+        
+        // Add repository if specified
+        if includeRepo, case .string(let repo) = args["repo"] {
+            cmdArgs.append("-R")
+            cmdArgs.append(repo)
+        }
+        
+        cmdArgs.append(contentsOf: additionalArgs)
+        return cmdArgs
+    }
+    
+    /// Fixed fragments of formatted responses.
+    private enum ResponseText {
+        static let success = "✅ Command executed successfully"
+        static let successNoOutput = "✅ Command executed successfully (no output)"
+        static let jsonBlockOpen = "\n\nJSON Output:\n```json\n"
+        static let outputBlockOpen = "\n\nOutput:\n```\n"
+        static let warningsBlockOpen = "\n\nWarnings/Info:\n```\n"
+        static let errorBlockOpen = "\n\nError:\n```\n"
+        static let blockClose = "\n```"
+        static let tipPrefix = "\n\n💡 **Tip**: "
+    }
+    
     private func formatResult(_ result: CommandResult) -> CallTool.Result {
+        // Size the response once; outputs are appended directly rather than
+        // interpolated into temporary strings.
         var response = ""
+        response.reserveCapacity((result.dataString ?? result.stdout).utf8.count + result.stderr.utf8.count + 256)
         
         if result.success {
             if let dataString = result.dataString {
-                response += "✅ Command executed successfully\n\n"
-                response += "JSON Output:\n```json\n\(dataString)\n```"
+                response += ResponseText.success
+                response += ResponseText.jsonBlockOpen
+                response += dataString
+                response += ResponseText.blockClose
             } else if !result.stdout.isEmpty {
-                response += "✅ Command executed successfully\n\n"
-                response += "Output:\n```\n\(result.stdout)\n```"
+                response += ResponseText.success
+                response += ResponseText.outputBlockOpen
+                response += result.stdout
+                response += ResponseText.blockClose
             } else {
-                response += "✅ Command executed successfully (no output)"
+                response += ResponseText.successNoOutput
             }
             
             if !result.stderr.isEmpty {
-                response += "\n\nWarnings/Info:\n```\n\(result.stderr)\n```"
+                response += ResponseText.warningsBlockOpen
+                response += result.stderr
+                response += ResponseText.blockClose
             }
         } else {
             response += "❌ Command failed (exit code \(result.returnCode))"
             
             if !result.stderr.isEmpty {
-                response += "\n\nError:\n```\n\(result.stderr)\n```"
+                response += ResponseText.errorBlockOpen
+                response += result.stderr
+                response += ResponseText.blockClose
                 
-                // Add helpful suggestions based on common errors
-                let stderrLower = result.stderr.lowercased()
-                if stderrLower.contains("authentication") || stderrLower.contains("401") {
-                    response += "\n\n💡 **Tip**: This looks like an authentication issue. Try running `glab auth login` in your terminal."
-                } else if stderrLower.contains("not found") || stderrLower.contains("404") {
-                    response += "\n\n💡 **Tip**: The resource was not found. Check if the MR/issue number or repository name is correct."
-                } else if stderrLower.contains("permission") || stderrLower.contains("403") {
-                    response += "\n\n💡 **Tip**: You don't have permission to perform this action. Check your access rights."
-                } else if stderrLower.contains("no repository") {
-                    response += "\n\n💡 **Tip**: Make sure you're in a Git repository or specify the repository with the 'repo' parameter."
+                // Add helpful suggestions based on common errors.
+                // Case-insensitive search avoids allocating a lowercased copy of stderr.
+                if let tip = Self.errorTips.first(where: { entry in
+                    entry.patterns.contains { result.stderr.range(of: $0, options: .caseInsensitive) != nil }
+                })?.tip {
+                    response += ResponseText.tipPrefix
+                    response += tip
                 }
             }
             
             if !result.stdout.isEmpty {
-                response += "\n\nOutput:\n```\n\(result.stdout)\n```"
+                response += ResponseText.outputBlockOpen
+                response += result.stdout
+                response += ResponseText.blockClose
             }
         }
         
@@ -517,43 +617,44 @@ actor GitLabMCPServer {
     
     // MARK: - Prompts
     
+    /// Prompt definitions never change, so they are built once like the tool list.
+    private static let prompts: [Prompt] = [
+        Prompt(
+            name: "my-mrs",
+            description: "Check your merge requests (requires authentication)",
+            arguments: [
+                .init(name: "repo", description: "Repository path (e.g., 'team/project')", required: false),
+                .init(name: "state", description: "Filter by state: opened, closed, merged, all", required: false)
+            ]
+        ),
+        Prompt(
+            name: "create-mr",
+            description: "Create a new merge request with proper title and description",
+            arguments: [
+                .init(name: "title", description: "MR title", required: true),
+                .init(name: "source_branch", description: "Source branch name", required: true),
+                .init(name: "target_branch", description: "Target branch (default: main)", required: false),
+                .init(name: "description", description: "MR description", required: false)
+            ]
+        ),
+        Prompt(
+            name: "daily-standup",
+            description: "Get a summary of your GitLab activity for daily standup",
+            arguments: [
+                .init(name: "days", description: "Number of days to look back (default: 1)", required: false)
+            ]
+        ),
+        Prompt(
+            name: "review-pipeline",
+            description: "Check CI/CD pipeline status and failures",
+            arguments: [
+                .init(name: "repo", description: "Repository path", required: false)
+            ]
+        )
+    ]
+    
     private func getPrompts() -> ListPrompts.Result {
-        let prompts = [
-            Prompt(
-                name: "my-mrs",
-                description: "Check your merge requests (requires authentication)",
-                arguments: [
-                    .init(name: "repo", description: "Repository path (e.g., 'team/project')", required: false),
-                    .init(name: "state", description: "Filter by state: opened, closed, merged, all", required: false)
-                ]
-            ),
-            Prompt(
-                name: "create-mr",
-                description: "Create a new merge request with proper title and description",
-                arguments: [
-                    .init(name: "title", description: "MR title", required: true),
-                    .init(name: "source_branch", description: "Source branch name", required: true),
-                    .init(name: "target_branch", description: "Target branch (default: main)", required: false),
-                    .init(name: "description", description: "MR description", required: false)
-                ]
-            ),
-            Prompt(
-                name: "daily-standup",
-                description: "Get a summary of your GitLab activity for daily standup",
-                arguments: [
-                    .init(name: "days", description: "Number of days to look back (default: 1)", required: false)
-                ]
-            ),
-            Prompt(
-                name: "review-pipeline",
-                description: "Check CI/CD pipeline status and failures",
-                arguments: [
-                    .init(name: "repo", description: "Repository path", required: false)
-                ]
-            )
-        ]
-        
-        return ListPrompts.Result(prompts: prompts)
+        return ListPrompts.Result(prompts: Self.prompts)
     }
     
     private func getPrompt(name: String, arguments: [String: Value]?) async throws -> GetPrompt.Result {